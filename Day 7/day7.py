@@ -1,56 +1,30 @@
-def count_splits(grid):
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # Find starting position
-    start_col = None
-    for j in range(cols):
-        if grid[0][j] == 'S':
-            start_col = j
-            break
-
-    if start_col is None:
-        return 0
-
-    # We'll process row by row since beams always go down
-    # Track active beams at each column
-    active_beams = {start_col}
-    splits = 0
-
-    for i in range(1, rows):  # Start from row below S
-        new_active_beams = set()
-
-        # Process each active beam from previous row
-        for col in active_beams:
-            # Beam moves down to current row
-            cell = grid[i][col]
+import sys
 
-            if cell == '^':
-                # Split occurs!
-                splits += 1
-                # New beams start from left and right of splitter
-                if col > 0:
-                    new_active_beams.add(col - 1)
-                if col < cols - 1:
-                    new_active_beams.add(col + 1)
-            else:
-                # Beam continues downward
-                new_active_beams.add(col)
+from manifold import count_splits_bitset, load_sparse, sweep_sparse, sweep_stream
 
-        active_beams = new_active_beams
 
-    return splits
-
-
-# Read input from file
-with open('day7_input.txt', 'r') as f:
-    grid = [line.rstrip('\n') for line in f]
-
-result = count_splits(grid)
-
-# Save answer to output file
-with open('day7_output.txt', 'w') as f:
-    f.write(str(result))
-
-print(f"Number of splits: {result}")
-print("Answer saved to day7_output.txt")
\ No newline at end of file
+def count_splits(grid):
+    return count_splits_bitset(grid)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "stream":
+        # Row-at-a-time sweep that can resume from a checkpoint after an interruption
+        checkpoint = sys.argv[2] if len(sys.argv) > 2 else None
+        result = sweep_stream('day7_input.txt', checkpoint)[0]
+    elif len(sys.argv) > 1 and sys.argv[1] == "sparse":
+        # Only splitter coordinates are kept, for very wide and sparse manifolds
+        result = sweep_sparse(*load_sparse('day7_input.txt'))[0]
+    else:
+        # Read input from file
+        with open('day7_input.txt', 'r') as f:
+            grid = [line.rstrip('\n') for line in f]
+
+        result = count_splits(grid)
+
+    # Save answer to output file
+    with open('day7_output.txt', 'w') as f:
+        f.write(str(result))
+
+    print(f"Number of splits: {result}")
+    print("Answer saved to day7_output.txt")
@@ -1,60 +1,40 @@
-def count_timelines(grid):
-    rows = len(grid)
-    cols = len(grid[0])
-
-    # Find starting position
-    start_col = None
-    for j in range(cols):
-        if grid[0][j] == 'S':
-            start_col = j
-            break
-
-    # Memoization: (row, col) -> number of paths from here to bottom
-    memo = {}
-
-    def dfs(row, col):
-        # Check memo
-        if (row, col) in memo:
-            return memo[(row, col)]
-
-        # If at bottom row, we have one complete path
-        if row == rows - 1:
-            return 1
-
-        # Check current cell
-        cell = grid[row][col]
-
-        total_paths = 0
+import sys
 
-        if cell == '^':
-            # At splitter: can go left OR right to adjacent cells in SAME row
-            # Then continue downward from there
-            if col > 0:
-                # Go left
-                total_paths += dfs(row, col - 1)
-            if col < cols - 1:
-                # Go right
-                total_paths += dfs(row, col + 1)
-        else:
-            # Not at splitter: continue straight down
-            total_paths += dfs(row + 1, col)
+from manifold import load_sparse, sweep, sweep_sparse, sweep_stream, timelines_by_start
 
-        memo[(row, col)] = total_paths
-        return total_paths
 
-    result = dfs(0, start_col)
-    return result
-
-
-# Read input from file
-with open('day7_input.txt', 'r') as f:
-    grid = [line.rstrip('\n') for line in f]
-
-result = count_timelines(grid)
-
-# Save answer to output file
-with open('day7_output2.txt', 'w') as f:
-    f.write(str(result))
-
-print(f"Number of timelines: {result}")
-print("Answer saved to day7_output2.txt")
\ No newline at end of file
+def count_timelines(grid):
+    _, timelines = sweep(grid)
+    return timelines
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "stream":
+        # Row-at-a-time sweep that can resume from a checkpoint after an interruption
+        checkpoint = sys.argv[2] if len(sys.argv) > 2 else None
+        result = sweep_stream('day7_input.txt', checkpoint)[1]
+    elif len(sys.argv) > 1 and sys.argv[1] == "sparse":
+        # Only splitter coordinates are kept, for very wide and sparse manifolds
+        result = sweep_sparse(*load_sparse('day7_input.txt'))[1]
+    elif len(sys.argv) > 1 and sys.argv[1] == "table":
+        # What-if: timelines for the start placed in every column of the top row
+        with open('day7_input.txt', 'r') as f:
+            grid = [line.rstrip('\n') for line in f]
+
+        table = timelines_by_start(grid)
+        for col, timelines in enumerate(table):
+            print(f"Start column {col}: {timelines}")
+        result = table[grid[0].index('S')]
+    else:
+        # Read input from file
+        with open('day7_input.txt', 'r') as f:
+            grid = [line.rstrip('\n') for line in f]
+
+        result = count_timelines(grid)
+
+    # Save answer to output file
+    with open('day7_output2.txt', 'w') as f:
+        f.write(str(result))
+
+    print(f"Number of timelines: {result}")
+    print("Answer saved to day7_output2.txt")
@@ -0,0 +1,239 @@
+import json
+import os
+
+# Maps '^' to the ASCII digit 1 and every other character to 0
+_SPLITTER_DIGITS = bytes(ord('1') if b == ord('^') else ord('0') for b in range(256))
+
+
+def find_start(first_row):
+    """Column of the 'S' in the top row, or None if there is no start."""
+    col = first_row.find('S')
+    return None if col == -1 else col
+
+
+def step_row(row, counts):
+    """
+    Move the per-column timeline counts through one row.
+
+    A beam emitted beside a splitter goes straight down to the next row, even if
+    the cell beside the splitter is another '^' (part 1's rule, for both parts).
+    Returns (splits in this row, counts leaving the row).
+    """
+    cols = len(counts)
+    splits = 0
+    new_counts = [0] * cols
+    for col, count in enumerate(counts):
+        if not count:
+            continue
+        if row[col] == '^':
+            # Split occurs! New beams start left and right of the splitter
+            splits += 1
+            if col > 0:
+                new_counts[col - 1] += count
+            if col < cols - 1:
+                new_counts[col + 1] += count
+        else:
+            # Beam continues downward
+            new_counts[col] += count
+    return splits, new_counts
+
+
+def sweep(grid):
+    """
+    Propagate the beam down the manifold one row at a time.
+
+    counts[col] is the number of timelines whose beam is in that column, so a
+    single forward pass gives both answers: a split happens once per occupied
+    column that meets a '^', and the timelines are the counts reaching the
+    bottom row. No recursion, so the grid can be arbitrarily tall.
+
+    Beams emitted beside a splitter follow part 1's rule and go straight down,
+    so adjacent splitters ('^^') do not re-split them within the same row. The
+    old recursive count_timelines moved them sideways into the neighbouring
+    '^' instead, and never terminated on such rows.
+    Returns (splits, timelines).
+    """
+    start_col = find_start(grid[0])
+    if start_col is None:
+        return 0, 0
+
+    counts = [0] * len(grid[0])
+    counts[start_col] = 1
+    splits = 0
+    timelines = 1
+
+    for row in grid[1:]:
+        # Every timeline that reaches the bottom row is complete
+        timelines = sum(counts)
+        row_splits, counts = step_row(row, counts)
+        splits += row_splits
+
+    return splits, timelines
+
+
+def load_sparse(path):
+    """
+    Read a manifold keeping only splitter coordinates.
+
+    Returns (cols, start_col, splitter_rows) where splitter_rows[i] is the set of
+    '^' columns in row i + 1 (the rows below the start row).
+    """
+    splitter_rows = []
+    with open(path, 'r') as f:
+        first_row = f.readline().rstrip('\n')
+        for line in f:
+            splitters = set()
+            col = line.find('^')
+            while col != -1:
+                splitters.add(col)
+                col = line.find('^', col + 1)
+            splitter_rows.append(splitters)
+    return len(first_row), find_start(first_row), splitter_rows
+
+
+def sweep_sparse(cols, start_col, splitter_rows):
+    """
+    sweep() for very wide, sparse manifolds.
+
+    Beams are a {col: count} map of the occupied columns only, so each row costs
+    O(active beams) rather than O(cols). Returns (splits, timelines).
+    """
+    if start_col is None:
+        return 0, 0
+
+    beams = {start_col: 1}
+    splits = 0
+    timelines = 1
+
+    for splitters in splitter_rows:
+        # Every timeline that reaches the bottom row is complete
+        timelines = sum(beams.values())
+        new_beams = {}
+        for col, count in beams.items():
+            if col in splitters:
+                splits += 1
+                if col > 0:
+                    new_beams[col - 1] = new_beams.get(col - 1, 0) + count
+                if col < cols - 1:
+                    new_beams[col + 1] = new_beams.get(col + 1, 0) + count
+            else:
+                new_beams[col] = new_beams.get(col, 0) + count
+        beams = new_beams
+
+    return splits, timelines
+
+
+def timelines_by_start(grid):
+    """
+    Timeline count for every possible entry column, from one bottom-up pass.
+
+    below[col] is the number of timelines for a beam entering the next row down
+    in that column. A beam entering the bottom row is one finished timeline; a
+    splitter sends it to both neighbouring columns of the row below, anything
+    else passes it straight down. The top row is where the beam starts, so
+    table[col] is the answer when 'S' sits in that column.
+    """
+    cols = len(grid[0])
+    below = [1] * cols
+    for row in reversed(grid[1:-1]):
+        current = []
+        for col in range(cols):
+            if row[col] == '^':
+                left = below[col - 1] if col > 0 else 0
+                right = below[col + 1] if col < cols - 1 else 0
+                current.append(left + right)
+            else:
+                current.append(below[col])
+        below = current
+    return below
+
+
+def save_checkpoint(path, state):
+    """Write the sweep state atomically so an interrupted write never corrupts it."""
+    state = dict(state)
+    # Only occupied columns are stored
+    state['counts'] = {col: count for col, count in enumerate(state['counts']) if count}
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, cols):
+    with open(path, 'r') as f:
+        state = json.load(f)
+    counts = [0] * cols
+    for col, count in state['counts'].items():
+        counts[int(col)] = count
+    state['counts'] = counts
+    return state
+
+
+def sweep_stream(path, checkpoint_path=None, checkpoint_every=10000):
+    """
+    Same answers as sweep(), reading the manifold one row at a time.
+
+    Only the current counts are kept, so memory is O(cols). With a checkpoint
+    path, the file offset and state are saved every checkpoint_every rows and a
+    later call resumes from there; the checkpoint is removed once the sweep ends.
+    """
+    with open(path, 'rb') as f:
+        first_row = f.readline().decode().rstrip('\n')
+        start_col = find_start(first_row)
+        if start_col is None:
+            return 0, 0
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            state = load_checkpoint(checkpoint_path, len(first_row))
+            f.seek(state['offset'])
+        else:
+            counts = [0] * len(first_row)
+            counts[start_col] = 1
+            state = {'offset': f.tell(), 'row': 1, 'splits': 0, 'timelines': 1, 'counts': counts}
+
+        for line in iter(f.readline, b''):
+            # Every timeline that reaches the bottom row is complete
+            state['timelines'] = sum(state['counts'])
+            row_splits, state['counts'] = step_row(line.decode().rstrip('\n'), state['counts'])
+            state['splits'] += row_splits
+            state['row'] += 1
+            state['offset'] = f.tell()
+
+            if checkpoint_path and state['row'] % checkpoint_every == 0:
+                save_checkpoint(checkpoint_path, state)
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    return state['splits'], state['timelines']
+
+
+def splitter_bits(row):
+    """Encode a row's splitters as an integer with bit c set when column c holds a '^'."""
+    if not row:
+        return 0
+    return int(row.encode().translate(_SPLITTER_DIGITS)[::-1], 2)
+
+
+def count_splits_bitset(grid):
+    """
+    Count splits with the active beams and each row's splitters held as bitsets.
+
+    A whole row is processed with a handful of big-integer operations, i.e. a
+    machine word of columns at a time instead of one column at a time.
+    """
+    start_col = find_start(grid[0])
+    if start_col is None:
+        return 0
+
+    edge = (1 << len(grid[0])) - 1  # Beams pushed past the right edge are dropped
+    beams = 1 << start_col
+    splits = 0
+
+    for row in grid[1:]:
+        splitters = splitter_bits(row)
+        hits = beams & splitters
+        splits += hits.bit_count()
+        beams = (beams & ~splitters) | ((hits << 1) & edge) | (hits >> 1)
+
+    return splits
@@ -1,28 +1,204 @@
-def solve():
-    with open("input.txt", "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
+import os
+import sys
+from multiprocessing import Pool
+
+DIAL_SIZE = 100
+START_POSITION = 50
+
+
+def count_zero_hits(dial, direction, steps, size=DIAL_SIZE):
+    """Return how many clicks of a single rotation land on 0, without stepping click by click."""
+    if direction == 'L':
+        # Mirror the dial so a left turn becomes a right turn from the reflected position
+        distance = (size - dial) % size
+    else:
+        distance = dial
+    return (distance + steps) // size
+
+
+def read_instructions(path):
+    """Yield (direction, steps) pairs one line at a time so huge files stay in constant memory."""
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield line[0], int(line[1:])
 
-    dial = 50
+
+def solve():
+    dial = START_POSITION
     count_zero = 0
 
-    for line in lines:
-        direction = line[0]
+    for direction, steps in read_instructions("input.txt"):
+        count_zero += count_zero_hits(dial, direction, steps)
+        if direction == 'L':
+            dial = (dial - steps) % DIAL_SIZE
+        else:
+            dial = (dial + steps) % DIAL_SIZE
+
+    # Save result to output.txt
+    with open("output.txt", "w") as f:
+        f.write(str(count_zero))
+
+    return count_zero
+
+
+def load_signed_steps(path):
+    """Parse the instruction file into a signed int64 array (L negative, R positive)."""
+    import numpy as np
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # Turn the direction prefixes into signs and let NumPy parse every number in one pass
+    data = data.replace(b"L", b"-").replace(b"R", b"")
+    return np.fromstring(data.decode(), dtype=np.int64, sep=" ")
+
+
+def zero_passes(before, after, signed, size=DIAL_SIZE):
+    """Per-rotation zero hits from unwrapped positions; works on arrays of any (broadcastable) shape."""
+    import numpy as np
+
+    # Dividing an unwrapped position by the dial size tells us which "lap"
+    # we are on, so zero passes are lap differences.
+    right_hits = after // size - before // size
+    left_hits = (before - 1) // size - (after - 1) // size
+    return np.where(signed >= 0, right_hits, left_hits)
+
+
+def solve_numpy():
+    """Vectorized version of solve() for files with millions of rotations."""
+    import numpy as np
+
+    signed = load_signed_steps("input.txt")
+
+    after = START_POSITION + np.cumsum(signed)
+    before = np.concatenate(([START_POSITION], after[:-1]))
+    count_zero = int(zero_passes(before, after, signed).sum())
+
+    with open("output.txt", "w") as f:
+        f.write(str(count_zero))
+
+    return count_zero
+
+
+def zero_counts_by_start(path="input.txt", sizes=(DIAL_SIZE,), chunk_elements=1 << 22):
+    """
+    Return {size: array} where array[s] is the zero count when the dial starts at s.
+
+    The instructions are parsed once and every (start position, rotation) pair is
+    evaluated as a 2-D array. Each chunk holds about chunk_elements cells, so the
+    number of rotations per chunk shrinks as the dial grows and memory stays bounded.
+    """
+    import numpy as np
+
+    signed = load_signed_steps(path)
+    offsets = np.cumsum(signed)
+    previous = np.concatenate(([0], offsets[:-1]))
+
+    counts = {}
+    for size in sizes:
+        starts = np.arange(size, dtype=np.int64)[:, None]
+        totals = np.zeros(size, dtype=np.int64)
+        step = max(1, chunk_elements // size)
+        for lo in range(0, len(signed), step):
+            hi = lo + step
+            before = starts + previous[None, lo:hi]
+            after = starts + offsets[None, lo:hi]
+            totals += zero_passes(before, after, signed[None, lo:hi], size).sum(axis=1)
+        counts[size] = totals
+
+    return counts
+
+
+def summarize_chunk(task):
+    """
+    Summarize the rotations whose lines start inside a byte range of the file.
+
+    Returns (net displacement, base hits, hits_by_offset) where the chunk's zero
+    count for an entry position e is base + hits_by_offset[e].
+    """
+    path, start, end = task
+    size = DIAL_SIZE
+
+    # Each rotation hits zero L // size times, plus once more when the entry
+    # position falls in a cyclic window of length L % size. The windows are
+    # accumulated in a difference array twice the dial size, so a window that
+    # wraps past the end needs no special case, and folded back at the end.
+    diff = [0] * (2 * size)
+    net = 0
+    base = 0
+
+    with open(path, "rb") as f:
+        if start > 0:
+            # Skip the partial line; it belongs to the previous chunk
+            f.seek(start - 1)
+            f.readline()
+        # Read the whole range at once, plus the rest of a line that runs past its end
+        data = f.read(max(0, end - f.tell()))
+        if data and not data.endswith(b"\n"):
+            data += f.readline()
+
+    for line in data.split():
         steps = int(line[1:])
+        if line[0] == 76:  # b'L'
+            # Clicks cover positions net-steps .. net-1 relative to the entry
+            net -= steps
+            low = net - 1
+        else:
+            # Clicks cover positions net+1 .. net+steps relative to the entry
+            low = net
+            net += steps
 
-        # Each single click
-        for _ in range(steps):
-            if direction == 'L':
-                dial = (dial - 1) % 100
-            else:
-                dial = (dial + 1) % 100
+        window = steps % size
+        base += steps // size
+        if window:
+            first = (-window - low) % size
+            diff[first] += 1
+            diff[first + window] -= 1
 
-            if dial == 0:
-                count_zero += 1
+    hits_by_offset = []
+    running = 0
+    for e in range(2 * size):
+        running += diff[e]
+        hits_by_offset.append(running)
+    hits_by_offset = [hits_by_offset[e] + hits_by_offset[e + size] for e in range(size)]
+
+    return net, base, hits_by_offset
+
+
+def solve_parallel(workers=None):
+    """Split input.txt into byte ranges, summarize them in a process pool and stitch the results."""
+    path = "input.txt"
+    workers = workers or os.cpu_count() or 1
+    file_size = os.path.getsize(path)
+    chunk = max(1, -(-file_size // workers))
+    tasks = [(path, lo, min(lo + chunk, file_size)) for lo in range(0, file_size, chunk)]
+
+    with Pool(workers) as pool:
+        summaries = pool.map(summarize_chunk, tasks)
+
+    # Sequential fix-up: each chunk's entry position is the previous chunk's exit
+    dial = START_POSITION
+    count_zero = 0
+    for net, base, hits_by_offset in summaries:
+        count_zero += base + hits_by_offset[dial]
+        dial = (dial + net) % DIAL_SIZE
 
-    # Save result to output.txt
     with open("output.txt", "w") as f:
         f.write(str(count_zero))
 
+    return count_zero
+
 
 if __name__ == "__main__":
-    solve()
+    if len(sys.argv) > 1 and sys.argv[1] == "numpy":
+        solve_numpy()
+    elif len(sys.argv) > 1 and sys.argv[1] == "sweep":
+        sizes = [int(arg) for arg in sys.argv[2:]] or [DIAL_SIZE]
+        for size, totals in zero_counts_by_start(sizes=sizes).items():
+            print(f"Dial size {size}: {totals.tolist()}")
+    elif len(sys.argv) > 1 and sys.argv[1] == "parallel":
+        solve_parallel(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    else:
+        solve()
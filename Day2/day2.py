@@ -1,3 +1,14 @@
+import mmap
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+TABLE_PATH = "day2_table.bin"
+TABLE_DIGITS = 12
+
+
 def is_invalid_part2(n):
     s = str(n)
     L = len(s)
@@ -9,22 +20,123 @@ def is_invalid_part2(n):
                 return True
     return False
 
-def solve_part2(input_line):
-    ranges = input_line.strip().split(',')
+def invalid_ids(start, end):
+    """
+    Yield every invalid ID in [start, end] in increasing order.
+
+    Instead of testing each number, build them directly: an L-digit number made of
+    a b-digit block repeated L // b times is block * repunit, where
+    repunit = 100..0100..01 (L // b ones, spaced b digits apart).
+    """
+    for L in range(max(2, len(str(start))), len(str(end)) + 1):
+        found = set()
+        for b in range(1, L // 2 + 1):
+            if L % b:
+                continue
+            repunit = (10 ** L - 1) // (10 ** b - 1)
+            # Clamp the block range so block * repunit stays inside [start, end]
+            lo = max(10 ** (b - 1), -(-start // repunit))
+            hi = min(10 ** b - 1, end // repunit)
+            for block in range(lo, hi + 1):
+                # A number with several periods (e.g. 111111) is generated more than once
+                found.add(block * repunit)
+        yield from sorted(found)
+
+
+def build_table(path=TABLE_PATH, max_digits=TABLE_DIGITS):
+    """
+    Write every invalid ID below 10 ** max_digits to a memory-mappable file.
+
+    Layout (all unsigned 64-bit): max_digits, n, the n sorted IDs, then n + 1 prefix sums.
+    The prefix sums must fit in 64 bits, which holds up to 12 digits; a full
+    10 ** 18 table would need ~10 ** 9 entries, so the digit limit is kept configurable.
+    """
+    values = array('Q', invalid_ids(10, 10 ** max_digits - 1))
+    prefix = array('Q', [0])
+    running = 0
+    for v in values:
+        running += v
+        prefix.append(running)
+
+    with open(path, "wb") as f:
+        array('Q', [max_digits, len(values)]).tofile(f)
+        values.tofile(f)
+        prefix.tofile(f)
+
+
+def load_table(path=TABLE_PATH):
+    """Map the table file into memory and return (limit, values, prefix) as zero-copy views."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    words = memoryview(mapped).cast('Q')
+    max_digits, n = words[0], words[1]
+    values = words[2:2 + n]
+    prefix = words[2 + n:]
+    return 10 ** max_digits, values, prefix
+
+
+def parse_ranges(text):
+    """Yield (start, end) pairs from 'a-b,c-d,...' text; commas and whitespace both separate ranges."""
+    for r in re.split(r'[,\s]+', text):
+        if r:
+            start_str, end_str = r.split('-')
+            yield int(start_str), int(end_str)
+
+
+def read_ranges(paths, chunk_size=1 << 16):
+    """Stream (start, end) pairs from one or more range files without loading them whole."""
+    for path in paths:
+        with open(path, "r") as f:
+            pending = ""
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                pending += chunk
+                # Everything up to the last separator is complete; keep the tail for the next read
+                cut = max(pending.rfind(','), pending.rfind('\n'))
+                if cut >= 0:
+                    yield from parse_ranges(pending[:cut])
+                    pending = pending[cut + 1:]
+            yield from parse_ranges(pending)
+
+
+def merge_ranges(ranges):
+    """Sort ranges and merge overlapping or adjacent ones so no ID is counted twice."""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:  # Overlapping or adjacent
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def solve_part2(ranges, table=None):
+    if isinstance(ranges, str):
+        ranges = parse_ranges(ranges)
+
     total = 0
-    for r in ranges:
-        if not r:
-            continue
-        start_str, end_str = r.split('-')
-        start = int(start_str)
-        end = int(end_str)
-        for n in range(start, end + 1):
-            if is_invalid_part2(n):
-                total += n
+    for start, end in merge_ranges(ranges):
+        if table is not None and end < table[0]:
+            # Two binary searches on the precomputed table
+            _, values, prefix = table
+            total += prefix[bisect_right(values, end)] - prefix[bisect_left(values, start)]
+        else:
+            total += sum(invalid_ids(start, end))
     return total
 
-# Your input
-input_line = "824-1475,967620-1012917,2727216511-2727316897,56345-141494,8811120-8999774,5727326-5922513,935306-961989,76751455-76787170,723458-849157,144648-162230,1597-3207,326085-472746,14-34,66-132,9453977670-9454023729,959903262-960027272,17168-26699,190-332,3351-5602,1-11,371280315-371448887,6252062-6312899,9696887156-9697040132,37-58,32770-52161,6443650762-6443689882,473092-582157,3309726-3347079,852735-912990,8294840594-8294926063,3773964-3884030,7718304-7809359,601947-677833,3434304207-3434405118,449-673,64525269-64702774,31545468-31784543,184451-308951,5771-11485"
 
-result = solve_part2(input_line)
-print(f"Part 2 result: {result}")
\ No newline at end of file
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "build":
+        build_table()
+        print(f"Table written to {TABLE_PATH}")
+        args = args[1:]
+
+    # Any number of range files can be given; overlaps between them are merged
+    paths = args or ["day2_input.txt"]
+    table = load_table() if os.path.exists(TABLE_PATH) else None
+    result = solve_part2(read_ranges(paths), table)
+    print(f"Part 2 result: {result}")
@@ -1,3 +1,9 @@
+import mmap
+import os
+import sys
+from multiprocessing import Pool
+
+
 def max_12_digit_joltage(line):
     """Return the maximum 12-digit number formed by selecting 12 positions i1 < i2 < ... < i12."""
     n = len(line)
@@ -20,17 +26,210 @@ def max_12_digit_joltage(line):
     return int(result)
 
 
-def solve_part2():
+def load_digit_blocks(path="day3_input.txt", block_rows=1 << 20):
+    """
+    Yield the banks as 2-D uint8 digit matrices of at most block_rows rows each.
+
+    All banks must have the same length. Reading a block at a time keeps memory
+    bounded by the block size instead of the whole file.
+    """
+    import numpy as np
+    from itertools import islice
+
+    width = None
+    with open(path, "rb") as f:
+        banks = (line.strip() for line in f)
+        banks = (line for line in banks if line)
+        while True:
+            block = list(islice(banks, block_rows))
+            if not block:
+                break
+            if width is None:
+                width = len(block[0])
+            if any(len(line) != width for line in block):
+                raise ValueError("all banks must have the same length for the matrix path")
+            raw = np.frombuffer(b"".join(block), dtype=np.uint8).reshape(len(block), width)
+            yield raw - ord("0")
+
+
+def max_joltage_matrix(digits, k=12):
+    """
+    Greedy k-digit selection for every bank at once.
+
+    Step i picks, in each row, the leftmost largest digit between that row's
+    current start and the shared window end n - k + i.
+    """
+    import numpy as np
+
+    rows, n = digits.shape
+    if k > n:
+        raise ValueError(f"cannot pick {k} digits from a bank of {n}")
+
+    # One signed working copy; digits already used (left of each row's start)
+    # are overwritten with -1 in place, with a reused mask buffer
+    work = digits.astype(np.int8)
+    used = np.empty((rows, n), dtype=bool)
+    cols = np.arange(n)
+    row_idx = np.arange(rows)
+
+    # int64 holds up to 18 digits; fall back to Python ints beyond that
+    results = np.zeros(rows, dtype=np.int64 if k <= 18 else object)
+    for i in range(k):
+        end = n - k + i + 1
+        best = work[:, :end].argmax(axis=1)  # argmax returns the first (leftmost) maximum
+        results = results * 10 + work[row_idx, best]
+        np.less_equal(cols[None, :], best[:, None], out=used)
+        np.putmask(work, used, -1)
+    return results
+
+
+def solve_numpy(k=12, block_rows=1 << 20):
+    # Blocks of banks are processed one at a time and their totals summed
     total = 0
-    # Read input
+    for digits in load_digit_blocks(block_rows=block_rows):
+        total += int(max_joltage_matrix(digits, k).sum())
+
+    with open("day3_OUTPUT.txt", "w") as out:
+        out.write(str(total))
+
+    print(f"Total output joltage (Part 2): {total}")
+    return total
+
+
+def build_sparse_table(line):
+    """
+    Build a sparse table over the digits of a bank.
+
+    table[j][i] is the leftmost position of the largest digit in line[i:i + 2 ** j].
+    Built once in O(n log n), it answers any range-max query in O(1).
+    """
+    digits = [int(ch) for ch in line]
+    table = [list(range(len(digits)))]
+    j = 1
+    while (1 << j) <= len(digits):
+        prev = table[-1]
+        half = 1 << (j - 1)
+        row = []
+        for i in range(len(digits) - (1 << j) + 1):
+            a, b = prev[i], prev[i + half]
+            row.append(a if digits[a] >= digits[b] else b)
+        table.append(row)
+        j += 1
+    return digits, table
+
+
+def range_max_position(sparse, lo, hi):
+    """Leftmost position of the largest digit in digits[lo..hi] (inclusive)."""
+    digits, table = sparse
+    j = (hi - lo + 1).bit_length() - 1
+    a = table[j][lo]
+    b = table[j][hi - (1 << j) + 1]
+    if digits[a] == digits[b]:
+        return min(a, b)
+    return a if digits[a] > digits[b] else b
+
+
+def max_k_digit_joltage(sparse, k):
+    """Greedy selection: each digit is the largest one that still leaves room for the rest."""
+    digits, _ = sparse
+    n = len(digits)
+    if k > n:
+        raise ValueError(f"cannot pick {k} digits from a bank of {n}")
+
+    result = 0
+    pos = 0
+    for i in range(k):
+        best = range_max_position(sparse, pos, n - k + i)
+        result = result * 10 + digits[best]
+        pos = best + 1
+    return result
+
+
+def solve_many(ks):
+    """Total joltage for several k values, building each bank's sparse table only once."""
+    totals = dict.fromkeys(ks, 0)
     with open("day3_input.txt", "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            sparse = build_sparse_table(line)
+            for k in ks:
+                totals[k] += max_k_digit_joltage(sparse, k)
+
+    # Own file, so the single-number part 2 answer in day3_OUTPUT.txt is left alone
+    with open("day3_output_k.txt", "w") as out:
+        for k, total in totals.items():
+            out.write(f"k={k}: {total}\n")
+
+    for k, total in totals.items():
+        print(f"Total output joltage (k={k}): {total}")
+    return totals
+
+
+def max_joltage_bytes(line, k=12):
+    """Same monotonic-stack selection as max_12_digit_joltage, but on raw ASCII bytes."""
+    to_remove = len(line) - k
+    stack = bytearray()
+    for digit in line:
+        while to_remove > 0 and stack and stack[-1] < digit:
+            stack.pop()
+            to_remove -= 1
+        stack.append(digit)
+    return int(stack[:k])
+
+
+def chunk_total(task):
+    """Sum the joltage of every bank in a newline-aligned byte range of the input file."""
+    path, start, end, k = task
+    total = 0
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            while pos < end:
+                stop = mm.find(b"\n", pos, end)
+                if stop == -1:
+                    stop = end
+                line = mm[pos:stop].strip()
+                if line:
+                    total += max_joltage_bytes(line, k)
+                pos = stop + 1
+    return total
 
-    results = []
-    for line in lines:
-        val = max_12_digit_joltage(line)
-        results.append(val)
-        total += val
+
+def solve_parallel(workers=None, k=12, path="day3_input.txt"):
+    """Split the input at newline boundaries and total the chunks in a process pool."""
+    workers = workers or os.cpu_count() or 1
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            bounds = [0]
+            for i in range(1, workers):
+                cut = mm.find(b"\n", max(bounds[-1], size * i // workers))
+                if cut == -1:
+                    break
+                bounds.append(cut + 1)
+            bounds.append(size)
+
+    tasks = [(path, lo, hi, k) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+    with Pool(workers) as pool:
+        total = sum(pool.map(chunk_total, tasks))
+
+    with open("day3_OUTPUT.txt", "w") as out:
+        out.write(str(total))
+
+    print(f"Total output joltage (Part 2): {total}")
+    return total
+
+
+def solve_part2():
+    total = 0
+    # Stream the banks one line at a time
+    with open("day3_input.txt", "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                total += max_12_digit_joltage(line)
 
     with open("day3_OUTPUT.txt", "w") as out:
         out.write(str(total))
@@ -40,4 +239,11 @@ def solve_part2():
 
 
 if __name__ == "__main__":
-    solve_part2()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "parallel":
+        solve_parallel(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    elif len(sys.argv) > 1 and sys.argv[1] == "numpy":
+        solve_numpy()
+    elif len(sys.argv) > 1:
+        solve_many([int(arg) for arg in sys.argv[1:]])
+    else:
+        solve_part2()
@@ -1,3 +1,12 @@
+import os
+import sys
+from multiprocessing import Pipe, Process
+
+
+# Maps '@' to the binary digit 1 and every other character to 0
+_ROLL_DIGITS = {i: '1' if i == ord('@') else '0' for i in range(128)}
+
+
 def count_adjacent_ats(grid, r, c, rows, cols):
     count = 0
     for dr in (-1, 0, 1):
@@ -10,33 +19,219 @@ def count_adjacent_ats(grid, r, c, rows, cols):
                     count += 1
     return count
 
-def solve():
-    with open("day4_input.txt", "r") as f:
-        grid = [list(line.strip()) for line in f]
+def peel_rounds(grid):
+    """
+    Run the removal rounds with a worklist instead of rescanning the grid.
 
+    Every '@' keeps a live neighbour count. A removed cell only decrements its
+    eight neighbours, and a neighbour joins the next round as soon as its count
+    drops below 4, so the total work is linear in the grid size.
+    Returns the number of cells removed in each round.
+    """
     rows = len(grid)
     cols = len(grid[0])
 
-    total_removed = 0
+    counts = [[-1] * cols for _ in range(rows)]  # -1 marks empty or removed cells
+    frontier = []
+    for r in range(rows):
+        for c in range(cols):
+            if grid[r][c] == '@':
+                counts[r][c] = count_adjacent_ats(grid, r, c, rows, cols)
+                if counts[r][c] < 4:
+                    frontier.append((r, c))
+
+    # Cells already scheduled (or removed) never get queued twice
+    for r, c in frontier:
+        counts[r][c] = -1
+
+    removed_per_round = []
+    while frontier:
+        removed_per_round.append(len(frontier))
+        next_frontier = []
+        for r, c in frontier:
+            grid[r][c] = '.'
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < rows and 0 <= nc < cols and counts[nr][nc] >= 0:
+                        counts[nr][nc] -= 1
+                        if counts[nr][nc] < 4:
+                            counts[nr][nc] = -1
+                            next_frontier.append((nr, nc))
+        frontier = next_frontier
+
+    return removed_per_round
 
+
+def load_bitboard(path):
+    """
+    Pack the whole grid into one integer, one bit per cell.
+
+    Row r, column c lives at bit r * stride + c. The stride is cols + 1 so every
+    row ends with an always-empty guard bit, which keeps horizontal and diagonal
+    shifts from wrapping into the neighbouring row.
+    """
+    row_digits = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                # Guard bit first, then the row reversed so column 0 is its lowest bit
+                row_digits.append('0' + line[::-1].translate(_ROLL_DIGITS))
+    if not row_digits:
+        return 0, 1
+
+    # Join all rows once (last row most significant) instead of OR-ing row by row,
+    # which would rebuild the whole board integer for every row
+    return int(''.join(reversed(row_digits)), 2), len(row_digits[0])
+
+
+def bitboard_rounds(board, stride):
+    """Removal rounds on a bitboard; returns the number of cells removed per round."""
+    removed_per_round = []
     while True:
-        to_remove = []
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] == '@':
-                    if count_adjacent_ats(grid, r, c, rows, cols) < 4:
-                        to_remove.append((r, c))
+        # Bit-sliced counter: (b3 b2 b1 b0) holds each cell's neighbour count
+        b0 = b1 = b2 = b3 = 0
+        for shift in (1, stride - 1, stride, stride + 1):
+            for neighbour in (board << shift, board >> shift):
+                carry0 = b0 & neighbour
+                b0 ^= neighbour
+                carry1 = b1 & carry0
+                b1 ^= carry0
+                carry2 = b2 & carry1
+                b2 ^= carry1
+                b3 |= carry2
 
+        # Fewer than 4 neighbours means neither the 4s nor the 8s bit is set
+        to_remove = board & ~(b2 | b3)
         if not to_remove:
+            return removed_per_round
+
+        board &= ~to_remove
+        removed_per_round.append(to_remove.bit_count())
+
+
+def solve_bitboard():
+    board, stride = load_bitboard("day4_input.txt")
+    total_removed = sum(bitboard_rounds(board, stride))
+
+    print(total_removed)
+    return total_removed
+
+
+def tile_round(tile, above, below, mask):
+    """One removal round on a tile of bit-packed rows, given the halo rows around it."""
+    padded = [above] + tile + [below]
+    updated = []
+    removed = 0
+    for i in range(1, len(padded) - 1):
+        row = padded[i]
+        b0 = b1 = b2 = b3 = 0
+        up, down = padded[i - 1], padded[i + 1]
+        neighbours = (
+            up << 1 & mask, up, up >> 1,
+            row << 1 & mask, row >> 1,
+            down << 1 & mask, down, down >> 1,
+        )
+        for neighbour in neighbours:
+            carry0 = b0 & neighbour
+            b0 ^= neighbour
+            carry1 = b1 & carry0
+            b1 ^= carry0
+            carry2 = b2 & carry1
+            b2 ^= carry1
+            b3 |= carry2
+
+        to_remove = row & ~(b2 | b3)
+        removed += to_remove.bit_count()
+        updated.append(row & ~to_remove)
+    tile[:] = updated
+    return removed
+
+
+def tile_worker(conn, path, lo, hi):
+    """Own rows lo..hi-1 of the grid and run rounds whenever the parent sends fresh halos."""
+    tile = []
+    cols = 0
+    with open(path, "r") as f:
+        # Blank lines are skipped here exactly as solve_tiled skips them when counting rows
+        grid_rows = (line.strip() for line in f)
+        for r, line in enumerate(line for line in grid_rows if line):
+            if r >= hi:
+                break
+            if r >= lo:
+                cols = len(line)
+                tile.append(int(line[::-1].translate(_ROLL_DIGITS), 2))
+    mask = (1 << cols) - 1
+
+    conn.send((tile[0], tile[-1]))
+    while True:
+        halos = conn.recv()
+        if halos is None:
             break
+        removed = tile_round(tile, *halos, mask)
+        conn.send((removed, tile[0], tile[-1]))
+    conn.close()
 
-        # Remove them
-        for r, c in to_remove:
-            grid[r][c] = '.'
 
-        total_removed += len(to_remove)
+def solve_tiled(workers=None, path="day4_input.txt"):
+    """
+    Split the grid into row tiles, one worker process per tile.
+
+    Rounds stay synchronous: between rounds the parent passes each tile the
+    current boundary rows of its neighbours (a one-row halo) and stops once a
+    round removes nothing. Each worker only ever holds its own rows.
+    """
+    with open(path, "r") as f:
+        rows = sum(1 for line in f if line.strip())
+    workers = min(workers or os.cpu_count() or 1, rows)
+
+    tiles = []
+    for t in range(workers):
+        lo, hi = rows * t // workers, rows * (t + 1) // workers
+        parent_conn, child_conn = Pipe()
+        proc = Process(target=tile_worker, args=(child_conn, path, lo, hi))
+        proc.start()
+        tiles.append((proc, parent_conn))
+
+    edges = [conn.recv() for _, conn in tiles]
+    total_removed = 0
+    while True:
+        for t, (_, conn) in enumerate(tiles):
+            above = edges[t - 1][1] if t > 0 else 0
+            below = edges[t + 1][0] if t < workers - 1 else 0
+            conn.send((above, below))
+
+        round_removed = 0
+        for t, (_, conn) in enumerate(tiles):
+            removed, first, last = conn.recv()
+            round_removed += removed
+            edges[t] = (first, last)
+
+        if not round_removed:
+            break
+        total_removed += round_removed
+
+    for proc, conn in tiles:
+        conn.send(None)
+        proc.join()
+
+    print(total_removed)
+    return total_removed
+
+
+def solve():
+    with open("day4_input.txt", "r") as f:
+        grid = [list(line.strip()) for line in f]
+
+    total_removed = sum(peel_rounds(grid))
 
     print(total_removed)
 
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "bitboard":
+        solve_bitboard()
+    elif len(sys.argv) > 1 and sys.argv[1] == "tiled":
+        solve_tiled(int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    else:
+        solve()
\ No newline at end of file
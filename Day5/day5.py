@@ -1,3 +1,8 @@
+import sys
+
+from interval_index import build_index, contains, contains_batch, parse_ranges
+
+
 def solve():
     with open('day5_input.txt', 'r') as f:
         content = f.read().strip()
@@ -9,11 +14,8 @@ def solve():
         print("Invalid input format")
         return
 
-    # Parse ranges
-    ranges = []
-    for line in parts[0].strip().split('\n'):
-        a, b = map(int, line.split('-'))
-        ranges.append((a, b))
+    # Parse ranges and merge them into a sorted index
+    index = build_index(parse_ranges(parts[0]))
 
     # Parse available IDs
     available_ids = list(map(int, parts[1].strip().split('\n')))
@@ -22,14 +24,8 @@ def solve():
     fresh_count = 0
 
     for ingredient_id in available_ids:
-        # Check if ID is in any range
-        is_fresh = False
-        for a, b in ranges:
-            if a <= ingredient_id <= b:
-                is_fresh = True
-                break
-
-        if is_fresh:
+        # Binary search for the only range that could contain the ID
+        if contains(index, ingredient_id):
             fresh_count += 1
 
     print(f"Number of fresh ingredient IDs: {fresh_count}")
@@ -41,5 +37,47 @@ def solve():
     return fresh_count
 
 
+def solve_numpy(chunk_size=1 << 20):
+    """
+    Stream the available-ID section in fixed-size byte chunks and classify each
+    chunk at once with searchsorted, so memory stays bounded for huge ID lists.
+    """
+    import numpy as np
+
+    with open('day5_input.txt', 'r') as f:
+        # Ranges come first, up to the blank line
+        range_lines = []
+        for line in f:
+            if not line.strip():
+                break
+            range_lines.append(line)
+        index = build_index(parse_ranges(''.join(range_lines)))
+        index = (np.array(index[0], dtype=np.int64), np.array(index[1], dtype=np.int64))
+
+        fresh_count = 0
+        pending = ''
+        while True:
+            chunk = f.read(chunk_size)
+            text = pending + chunk
+            if chunk:
+                # Hold back the last (possibly partial) line for the next chunk
+                cut = text.rfind('\n') + 1
+                text, pending = text[:cut], text[cut:]
+            ids = np.fromstring(text, dtype=np.int64, sep=' ')
+            fresh_count += int(contains_batch(index, ids).sum())
+            if not chunk:
+                break
+
+    print(f"Number of fresh ingredient IDs: {fresh_count}")
+
+    with open('day5_output.txt', 'w') as f:
+        f.write(str(fresh_count))
+
+    return fresh_count
+
+
 if __name__ == "__main__":
-    result = solve()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "numpy":
+        result = solve_numpy()
+    else:
+        result = solve()
\ No newline at end of file
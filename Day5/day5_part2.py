@@ -1,3 +1,8 @@
+import sys
+
+from interval_index import IntervalSet, build_index, covered_count, parse_ranges, replay_events
+
+
 def solve():
     with open('day5_input.txt', 'r') as f:
         content = f.read()
@@ -10,40 +15,17 @@ def solve():
         return 0
 
     # Parse only the ranges from the first part (before blank line)
-    ranges = []
-    for line in parts[0].strip().split('\n'):
-        line = line.strip()
-        if line and '-' in line:
-            a, b = map(int, line.split('-'))
-            ranges.append((a, b))
+    ranges = parse_ranges(parts[0])
 
     print(f"Number of ranges: {len(ranges)}")
 
-    # Find all unique IDs covered by any range
-    # Since the numbers are large, we need an efficient approach
-    # Sort ranges by start
-    ranges.sort(key=lambda x: x[0])
-
-    # Merge overlapping ranges
-    merged_ranges = []
-    current_start, current_end = ranges[0]
+    # Sort and merge overlapping ranges; the numbers are large, so count
+    # IDs per merged range instead of enumerating them
+    index = build_index(ranges)
 
-    for start, end in ranges[1:]:
-        if start <= current_end + 1:  # Overlapping or adjacent
-            if end > current_end:
-                current_end = end
-        else:
-            merged_ranges.append((current_start, current_end))
-            current_start, current_end = start, end
+    print(f"Number of merged ranges: {len(index[0])}")
 
-    merged_ranges.append((current_start, current_end))
-
-    print(f"Number of merged ranges: {len(merged_ranges)}")
-
-    # Calculate total number of IDs
-    total_ids = 0
-    for start, end in merged_ranges:
-        total_ids += (end - start + 1)
+    total_ids = covered_count(index)
 
     print(f"Total unique IDs covered: {total_ids}")
 
@@ -54,5 +36,22 @@ def solve():
     return total_ids
 
 
+def replay(events_path):
+    """Start from the catalog in day5_input.txt and follow the fresh total through an event file."""
+    with open('day5_input.txt', 'r') as f:
+        content = f.read()
+
+    fresh = IntervalSet(parse_ranges(content.strip().split('\n\n')[0]))
+    print(f"Initial fresh IDs: {fresh.total}")
+
+    for event, total in replay_events(fresh, events_path):
+        print(f"{event}: {total}")
+
+    return fresh.total
+
+
 if __name__ == "__main__":
-    solve()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        replay(sys.argv[1])
+    else:
+        solve()
\ No newline at end of file
@@ -0,0 +1,129 @@
+from bisect import bisect_left, bisect_right
+
+
+def merge_ranges(ranges):
+    """Sort (start, end) ranges and merge the overlapping or adjacent ones."""
+    merged_ranges = []
+    for start, end in sorted(ranges):
+        if merged_ranges and start <= merged_ranges[-1][1] + 1:  # Overlapping or adjacent
+            if end > merged_ranges[-1][1]:
+                merged_ranges[-1] = (merged_ranges[-1][0], end)
+        else:
+            merged_ranges.append((start, end))
+    return merged_ranges
+
+
+def build_index(ranges):
+    """Merge the ranges once and return them as parallel sorted (starts, ends) lists."""
+    merged_ranges = merge_ranges(ranges)
+    starts = [start for start, _ in merged_ranges]
+    ends = [end for _, end in merged_ranges]
+    return starts, ends
+
+
+def contains(index, value):
+    """True if value falls inside one of the merged ranges, found with a single bisect."""
+    starts, ends = index
+    # The only candidate is the last range starting at or before value
+    i = bisect_right(starts, value) - 1
+    return i >= 0 and value <= ends[i]
+
+
+def contains_batch(index, values):
+    """Vectorized contains() for an int64 NumPy array of IDs; returns a boolean mask."""
+    import numpy as np
+
+    starts = np.asarray(index[0], dtype=np.int64)
+    ends = np.asarray(index[1], dtype=np.int64)
+    i = np.searchsorted(starts, values, side='right') - 1
+    return (i >= 0) & (values <= ends[np.maximum(i, 0)])
+
+
+def covered_count(index):
+    """Number of distinct IDs covered by the merged ranges."""
+    starts, ends = index
+    return sum(end - start + 1 for start, end in zip(starts, ends))
+
+
+def parse_ranges(block):
+    """Parse 'a-b' lines from the first section of the input."""
+    ranges = []
+    for line in block.strip().split('\n'):
+        line = line.strip()
+        if line and '-' in line:
+            a, b = map(int, line.split('-'))
+            ranges.append((a, b))
+    return ranges
+
+
+class IntervalSet:
+    """
+    Disjoint, sorted intervals that can be updated in place.
+
+    Adding unions a range into the set and removing subtracts it, so the set
+    always holds exactly the IDs that are currently fresh. Each update finds the
+    affected intervals with bisect and keeps `total` (the covered-ID count) up to
+    date, so the fresh total never has to be recomputed from scratch.
+    """
+
+    def __init__(self, ranges=()):
+        self.starts, self.ends = build_index(ranges)
+        self.total = covered_count((self.starts, self.ends))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __contains__(self, value):
+        return contains((self.starts, self.ends), value)
+
+    def add(self, start, end):
+        # Intervals overlapping or touching [start, end] form the slice i:j
+        i = bisect_left(self.ends, start - 1)
+        j = bisect_right(self.starts, end + 1)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+            self.total -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+        self.total += end - start + 1
+
+    def remove(self, start, end):
+        # Intervals overlapping [start, end] form the slice i:j
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        if i >= j:
+            return
+        # Parts of the first and last interval that stick out survive the removal
+        kept = []
+        if self.starts[i] < start:
+            kept.append((self.starts[i], start - 1))
+        if self.ends[j - 1] > end:
+            kept.append((end + 1, self.ends[j - 1]))
+
+        self.total -= sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+        self.total += sum(b - a + 1 for a, b in kept)
+        self.starts[i:j] = [a for a, _ in kept]
+        self.ends[i:j] = [b for _, b in kept]
+
+
+def replay_events(interval_set, path):
+    """
+    Apply 'add a-b' / 'remove a-b' lines from an event file one at a time.
+
+    Yields (event, total) after each update so callers can follow the live fresh-ID count.
+    """
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            action, span = line.split()
+            a, b = map(int, span.split('-'))
+            if action == 'add':
+                interval_set.add(a, b)
+            elif action == 'remove':
+                interval_set.remove(a, b)
+            else:
+                raise ValueError(f"Unknown event: {line}")
+            yield line, interval_set.total
@@ -1,57 +1,19 @@
+from worksheet import apply_operator, operator, problem_spans, row_numbers, split_rows
+
+
 def parse_worksheet(data):
     """
     Parse the worksheet data and return the grand total of all problems.
     """
-    rows = data.strip().split('\n')
-    max_len = max(len(r) for r in rows)
-
-    # Pad all rows to the same length
-    rows = [r.ljust(max_len) for r in rows]
-    n_rows = len(rows)
-    n_num_rows = n_rows - 1  # Last row is operators
-
-    problems = []  # Will store lists of column characters for each problem
-    current_problem_cols = []
-
-    # Scan column by column
-    for col in range(max_len):
-        column_chars = [rows[r][col] for r in range(n_rows)]
-
-        # Check if this is a separator column (all spaces)
-        if all(ch == ' ' for ch in column_chars):
-            if current_problem_cols:
-                problems.append(current_problem_cols)
-                current_problem_cols = []
-        else:
-            current_problem_cols.append(column_chars)
-
-    # Don't forget the last problem if there is one
-    if current_problem_cols:
-        problems.append(current_problem_cols)
+    rows = split_rows(data)
 
     # Calculate results for each problem
     results = []
-    for prob_cols in problems:
-        # Extract numbers from each number row
-        num_vals = []
-        for r in range(n_num_rows):
-            # Join all characters in this row across the problem's columns
-            num_str = ''.join(prob_cols[c][r] for c in range(len(prob_cols)))
-            num_str = num_str.strip()
-            if num_str:
-                num_vals.append(int(num_str))
-
-        # Extract operator from the last row
-        op_row = ''.join(prob_cols[c][n_num_rows] for c in range(len(prob_cols)))
-        op_char = op_row.strip()[0]  # Get the first non-space character
+    for start, end in problem_spans(rows):
+        num_vals = row_numbers(rows, start, end)
 
         # Calculate based on operator
-        if op_char == '*':
-            result = 1
-            for n in num_vals:
-                result *= n
-        else:  # '+'
-            result = sum(num_vals)
+        result = apply_operator(operator(rows, start, end), num_vals)
 
         results.append(result)
 
@@ -0,0 +1,40 @@
+import sys
+
+from worksheet import evaluate, evaluate_parallel
+
+
+def main():
+    # Read the worksheet once for both parts
+    try:
+        with open('day6_input.txt', 'r') as f:
+            data = f.read()
+    except FileNotFoundError:
+        print("Error: day6_input.txt not found!")
+        return
+
+    if len(sys.argv) > 1 and sys.argv[1] == "parallel":
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+        part1_total, part2_total, results = evaluate_parallel(data, workers, keep_results=True)
+    else:
+        part1_total, part2_total, results = evaluate(data, keep_results=True)
+
+    print(f"Number of problems solved: {len(results)}")
+    print(f"Grand total (Part 1): {part1_total}")
+    print(f"Grand total (Part 2): {part2_total}")
+
+    # Save both outputs in the same format as the single-part scripts
+    with open('day6_output.txt', 'w') as f:
+        f.write(f"Grand total: {part1_total}\n")
+        f.write(f"Number of problems: {len(results)}\n")
+        f.write("\nIndividual problem results:\n")
+        for i, (result, _) in enumerate(results, 1):
+            f.write(f"Problem {i}: {result}\n")
+
+    with open('day6_part2_output.txt', 'w') as f:
+        f.write(str(part2_total))
+
+    print("Results saved to day6_output.txt and day6_part2_output.txt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# Maps every byte to 1 except the space, which maps to 0
+_OCCUPIED = bytes(0 if b == ord(' ') else 1 for b in range(256))
+
+
+def split_rows(data):
+    """Split worksheet text into byte rows, dropping trailing blank lines but keeping indentation."""
+    if isinstance(data, str):
+        data = data.encode()
+    return data.rstrip(b'\n').split(b'\n')
+
+
+def problem_spans(rows):
+    """
+    Yield (start, end) column spans of the problems, left to right.
+
+    A column separates problems when it is blank in every row. Instead of padding
+    and transposing, each row is turned into a 0/1 occupancy string, read as a
+    little-endian integer and OR-ed together, so byte c of the result says whether
+    column c is used in any row. Rows of different lengths need no padding.
+    """
+    occupied = 0
+    width = 0
+    for row in rows:
+        occupied |= int.from_bytes(row.translate(_OCCUPIED), 'little')
+        width = max(width, len(row))
+    mask = occupied.to_bytes(width, 'little')
+
+    col = mask.find(1)
+    while col != -1:
+        end = mask.find(0, col)
+        if end == -1:
+            end = width
+        yield col, end
+        col = mask.find(1, end)
+
+
+def row_numbers(rows, start, end):
+    """Numbers written left to right in each number row of a problem (part 1)."""
+    numbers = []
+    for row in rows[:-1]:
+        num_str = row[start:end].strip()
+        if num_str:
+            numbers.append(int(num_str))
+    return numbers
+
+
+def column_numbers(rows, start, end):
+    """Numbers written top to bottom in each column of a problem (part 2)."""
+    width = end - start
+    cells = [row[start:end].ljust(width) for row in rows[:-1]]
+    numbers = []
+    for column in zip(*cells):
+        digits = bytes(column).replace(b' ', b'')
+        if digits:
+            numbers.append(int(digits))
+    return numbers
+
+
+def operator(rows, start, end):
+    """The operator character ('+' or '*') under a problem."""
+    return rows[-1][start:end].strip()[:1].decode()
+
+
+def product(numbers):
+    """
+    Multiply with a balanced product tree.
+
+    Multiplying left to right keeps growing one huge operand, which makes the
+    big-integer work quadratic; pairing neighbours keeps operands balanced.
+    """
+    numbers = list(numbers) or [1]
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+
+def apply_operator(op, numbers):
+    """Combine a problem's numbers with its operator."""
+    if op == '*':
+        return product(numbers)
+    return sum(numbers)  # '+'
+
+
+def solve_problem(cells):
+    """Both part results for one problem, given its rows already cut to its columns."""
+    width = max(len(row) for row in cells)
+    op = operator(cells, 0, width)
+    return (
+        apply_operator(op, row_numbers(cells, 0, width)),
+        apply_operator(op, column_numbers(cells, 0, width)),
+    )
+
+
+def evaluate_parallel(data, workers=None, keep_results=False):
+    """Same as evaluate(), but independent problems are solved across a process pool."""
+    from multiprocessing import Pool
+
+    rows = split_rows(data)
+    # Problems are cut at separator columns, so each one can be shipped on its own
+    problems = ([row[start:end] for row in rows] for start, end in problem_spans(rows))
+
+    with Pool(workers) as pool:
+        per_problem = list(pool.imap(solve_problem, problems, chunksize=16))
+
+    part1_total = sum(part1 for part1, _ in per_problem)
+    part2_total = sum(part2 for _, part2 in per_problem)
+    return part1_total, part2_total, per_problem if keep_results else None
+
+
+def evaluate(data, keep_results=False):
+    """
+    Segment the worksheet once and solve both parts from the same spans.
+
+    Returns (part1_total, part2_total, results) where results is a list of
+    (part1_result, part2_result) per problem when keep_results is set, else None.
+    """
+    rows = split_rows(data)
+
+    part1_total = 0
+    part2_total = 0
+    results = [] if keep_results else None
+    for start, end in problem_spans(rows):
+        op = operator(rows, start, end)
+        part1 = apply_operator(op, row_numbers(rows, start, end))
+        part2 = apply_operator(op, column_numbers(rows, start, end))
+        part1_total += part1
+        part2_total += part2
+        if keep_results:
+            results.append((part1, part2))
+
+    return part1_total, part2_total, results
@@ -1,4 +1,9 @@
-def day08():
+import sys
+
+from dsu import connect_boxes
+
+
+def day08(checkpoints=(1000,)):
     part = [0, 0]
 
     # Read input from the file
@@ -28,85 +33,43 @@ def day08():
     print("Sorting distances...")
     workpairs = sorted(distances, key=lambda x: x[1])
 
-    # Convert to list for easier popping (like Julia's popfirst!)
-    workpairs_list = list(workpairs)
-
-    used = set()
-    circuits = []  # List of sets
-
     print("Processing connections...")
-    connection_count = 0
-
-    while workpairs_list:
-        connection_count += 1
-        (a, b), dist = workpairs_list.pop(0)  # popfirst!
-
-        # Convert to 0-based for Python
-        a -= 1
-        b -= 1
-
-        if a in used and b in used:
-            # Find circuits containing a and b
-            ca_idx = -1
-            cb_idx = -1
-            for i, circuit in enumerate(circuits):
-                if a in circuit:
-                    ca_idx = i
-                if b in circuit:
-                    cb_idx = i
-
-            if ca_idx != cb_idx and ca_idx != -1 and cb_idx != -1:
-                # Merge circuits
-                circuits[ca_idx].update(circuits[cb_idx])
-                circuits.pop(cb_idx)
-
-                # Check if done (all boxes in one circuit)
-                if len(circuits) == 1 and len(circuits[0]) == nboxes:
-                    part[1] = boxes[a][0] * boxes[b][0]
-                    print(f"Part 2: All boxes connected at connection {connection_count}")
-                    print(f"  Box {a + 1} X: {boxes[a][0]}, Box {b + 1} X: {boxes[b][0]}")
-                    print(f"  Product: {part[1]}")
-                    break
-        elif a in used:
-            # Add b to circuit containing a
-            for circuit in circuits:
-                if a in circuit:
-                    circuit.add(b)
-                    break
-        elif b in used:
-            # Add a to circuit containing b
-            for circuit in circuits:
-                if b in circuit:
-                    circuit.add(a)
-                    break
-        else:
-            # Make new circuit
-            circuits.append(set([a, b]))
-
-        used.add(a)
-        used.add(b)
-
-        # Part 1: After 1000 connections
-        if connection_count == 1000:
-            # Sort circuits by size, get top 3
-            circuits_sorted = sorted(circuits, key=len, reverse=True)
-            if len(circuits_sorted) >= 3:
-                part[0] = len(circuits_sorted[0]) * len(circuits_sorted[1]) * len(circuits_sorted[2])
-            elif len(circuits_sorted) == 2:
-                part[0] = len(circuits_sorted[0]) * len(circuits_sorted[1]) * 1
-            elif len(circuits_sorted) == 1:
-                part[0] = len(circuits_sorted[0]) * 1 * 1
-            print(f"Part 1 after 1000 connections: {part[0]}")
-            print(f"  Circuit sizes: {[len(c) for c in circuits_sorted[:5]]}")
+    # Convert to 0-based for Python
+    edges = [(a - 1, b - 1) for (a, b), dist in workpairs]
+    # The puzzle's own checkpoint (1000) is always included
+    sizes_at, last_edge = connect_boxes(nboxes, edges, set(checkpoints) | {1000}, k=3)
+
+    # Part 1: product of the three largest circuits after each checkpoint
+    for checkpoint in sorted(sizes_at):
+        top = sizes_at[checkpoint]
+        product = 1
+        for size in top:
+            product *= size
+        if checkpoint == 1000:
+            part[0] = product
+        print(f"Part 1 after {checkpoint} connections: {product}")
+        print(f"  Circuit sizes: {top}")
+
+    # Part 2: the connection that joined every box into one circuit
+    if last_edge is not None:
+        a, b = last_edge
+        part[1] = boxes[a][0] * boxes[b][0]
+        print("Part 2: All boxes connected")
+        print(f"  Box {a + 1} X: {boxes[a][0]}, Box {b + 1} X: {boxes[b][0]}")
+        print(f"  Product: {part[1]}")
 
     return part
 
 
-# Run it
-print("=" * 60)
-print("Running Day 8 Solution (Julia-style)")
-print("=" * 60)
-result = day08()
-print(f"\n✅ Final Results:")
-print(f"  Part 1: {result[0]}")
-print(f"  Part 2: {result[1]}")
\ No newline at end of file
+if __name__ == "__main__":
+    checkpoints = [int(arg) for arg in sys.argv[1:]] or [1000]
+    if any(checkpoint < 0 for checkpoint in checkpoints):
+        sys.exit("Checkpoints must be non-negative connection counts")
+
+    print("=" * 60)
+    print("Running Day 8 Solution (Julia-style)")
+    print("=" * 60)
+    result = day08(checkpoints)
+    print(f"\n✅ Final Results:")
+    print(f"  Part 1: {result[0]}")
+    print(f"  Part 2: {result[1]}")
@@ -0,0 +1,93 @@
+from bisect import bisect_left, insort
+
+
+class DisjointSet:
+    """
+    Union-find over boxes 0..n-1 that also tracks the circuits themselves.
+
+    Besides parent/rank/size it keeps the number of components and a sorted list
+    of every component's size, updated on each successful union, so "are all
+    boxes connected?" is O(1) and the largest sizes are read off the end.
+    """
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.size = [1] * n
+        self.components = n
+        self.sizes = [1] * n  # Sorted ascending
+
+    def find(self, x):
+        # Path halving keeps this iterative, so long chains cannot hit the recursion limit
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, x, y):
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+        if self.rank[root_x] == self.rank[root_y]:
+            self.rank[root_x] += 1
+
+        self._drop_size(self.size[root_x])
+        self._drop_size(self.size[root_y])
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        insort(self.sizes, self.size[root_x])
+        self.components -= 1
+        return True
+
+    def _drop_size(self, size):
+        del self.sizes[bisect_left(self.sizes, size)]
+
+    def connected(self):
+        return self.components == 1
+
+    def top_sizes(self, k):
+        """The k largest component sizes, largest first (singletons count as size 1)."""
+        return self.sizes[:-k - 1:-1] if k else []
+
+
+def connect_boxes(n, edges, checkpoints=(), k=3):
+    """
+    Add edges in order in a single pass.
+
+    Returns (sizes_at, last_edge): sizes_at maps each checkpoint K to the k largest
+    circuit sizes after the first K edges, and last_edge is the edge (a, b) whose
+    union connected every box, or None if that never happens.
+    """
+    pending = sorted(set(checkpoints))
+    if pending and pending[0] < 0:
+        raise ValueError(f"checkpoints must be non-negative, got {pending[0]}")
+
+    dsu = DisjointSet(n)
+    next_checkpoint = 0
+    sizes_at = {}
+    last_edge = None
+
+    while next_checkpoint < len(pending) and pending[next_checkpoint] == 0:
+        sizes_at[0] = dsu.top_sizes(k)
+        next_checkpoint += 1
+
+    for count, (a, b) in enumerate(edges, 1):
+        if dsu.union(a, b) and last_edge is None and dsu.connected():
+            last_edge = (a, b)
+
+        if next_checkpoint < len(pending) and pending[next_checkpoint] == count:
+            sizes_at[count] = dsu.top_sizes(k)
+            next_checkpoint += 1
+
+        if last_edge is not None and next_checkpoint == len(pending):
+            break
+
+    # Checkpoints past the last edge see the final circuits
+    for checkpoint in pending[next_checkpoint:]:
+        sizes_at[checkpoint] = dsu.top_sizes(k)
+
+    return sizes_at, last_edge